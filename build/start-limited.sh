@@ -9,6 +9,8 @@ CPU_CORES=${CPU_CORES:-2}
 GOMAXPROCS=${GOMAXPROCS:-$CPU_CORES}
 GOMEMLIMIT=${GOMEMLIMIT:-256MiB}
 GODEBUG=${GODEBUG:-""}
+# Explicit taskset CPU list (e.g. "2,3"); keeps the server off the cores used by a load generator
+CPU_MASK=${CPU_MASK:-""}
 
 echo "=== BRM Go Server - Resource Limited Mode ==="
 echo "CPU Cores: $CPU_CORES"
@@ -30,7 +32,9 @@ if [ -n "$GODEBUG" ]; then
 fi
 
 # Determine CPU affinity mask for taskset
-if [ "$CPU_CORES" -eq 1 ]; then
+if [ -n "$CPU_MASK" ]; then
+    : # Use the explicitly provided CPU list
+elif [ "$CPU_CORES" -eq 1 ]; then
     CPU_MASK="0"
 elif [ "$CPU_CORES" -eq 2 ]; then
     CPU_MASK="0,1"
@@ -325,14 +325,15 @@ func (s *DockerRegistryPrivateService) PutManifest(ctx context.Context, name, re
 // StartBlobUpload creates a new blob upload session
 func (s *DockerRegistryPrivateService) StartBlobUpload(ctx context.Context, name string) (string, error) {
 	// Generate UUID for session
-	uuid := fmt.Sprintf("%d-%d", time.Now().UnixNano(), len(s.uploadSessions))
+	now := time.Now()
+	uuid := fmt.Sprintf("%d-%d", now.UnixNano(), len(s.uploadSessions))
 
 	session := &UploadSession{
 		UUID:      uuid,
 		Name:      name,
 		Size:      0,
 		Offset:    0,
-		CreatedAt: time.Now(),
+		CreatedAt: now,
 	}
 
 	s.sessionsMutex.Lock()
@@ -344,9 +345,9 @@ func (s *DockerRegistryPrivateService) StartBlobUpload(ctx context.Context, name
 
 // UploadBlobChunk uploads a chunk of blob data to an existing session
 func (s *DockerRegistryPrivateService) UploadBlobChunk(ctx context.Context, name, uuid string, data io.Reader, offset int64) (int64, error) {
-	s.sessionsMutex.Lock()
+	s.sessionsMutex.RLock()
 	session, exists := s.uploadSessions[uuid]
-	s.sessionsMutex.Unlock()
+	s.sessionsMutex.RUnlock()
 
 	if !exists {
 		return 0, fmt.Errorf("upload session not found")
@@ -2,6 +2,7 @@ package proxy
 
 import (
 	"context"
+	"encoding/base64"
 	"fmt"
 	"io"
 	"net/http"
@@ -10,26 +11,60 @@ import (
 	"github.com/basakil/brm-server/pkg/models"
 )
 
+// maxIdleConnsPerUpstream bounds the keep-alive pool kept open to an upstream registry.
+// http.DefaultTransport keeps only 2 idle connections per host, which forces concurrent
+// pulls through the proxy to keep dialing (and TLS handshaking) new connections.
+const maxIdleConnsPerUpstream = 64
+
+// maxManifestSize caps how much of an upstream manifest response is buffered in memory.
+// Manifests are small JSON documents; anything larger is rejected instead of read unbounded.
+const maxManifestSize = 4 << 20
+
+// maxDrainSize bounds how much of an unread response body is discarded before closing it.
+const maxDrainSize = 64 << 10
+
+// manifestHeaders are the request headers sent when fetching or checking manifests upstream.
+// Shared and read-only; makeRequest only copies them onto each request.
+var manifestHeaders = map[string]string{
+	"Accept": "application/vnd.docker.distribution.manifest.v2+json, application/vnd.oci.image.manifest.v1+json, */*",
+}
+
 // DockerRegistryProxyClient handles HTTP communication with upstream Docker registries
 type DockerRegistryProxyClient struct {
 	baseURL    string
-	username   string
-	password   string
+	authHeader string // Precomputed Authorization header value, empty if no credentials
 	httpClient *http.Client
 }
 
 // NewDockerRegistryProxyClient creates a new client for upstream registry communication
 func NewDockerRegistryProxyClient(upstream *models.UpstreamRegistry) *DockerRegistryProxyClient {
+	// Encode credentials once instead of on every request
+	authHeader := ""
+	if upstream.Username != "" && upstream.Password != "" {
+		credentials := upstream.Username + ":" + upstream.Password
+		authHeader = "Basic " + base64.StdEncoding.EncodeToString([]byte(credentials))
+	}
+
 	return &DockerRegistryProxyClient{
-		baseURL:  upstream.URL,
-		username: upstream.Username,
-		password: upstream.Password,
+		baseURL:    upstream.URL,
+		authHeader: authHeader,
 		httpClient: &http.Client{
-			Timeout: 30 * time.Second,
+			Timeout:   30 * time.Second,
+			Transport: newUpstreamTransport(),
 		},
 	}
 }
 
+// newUpstreamTransport creates a dedicated transport for a single upstream registry.
+// Each client keeps its own keep-alive connection pool instead of sharing http.DefaultTransport,
+// so connections to the upstream are reused across requests without contending with other clients.
+func newUpstreamTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = maxIdleConnsPerUpstream
+	transport.MaxIdleConnsPerHost = maxIdleConnsPerUpstream
+	return transport
+}
+
 // makeRequest makes an HTTP request to the upstream registry with authentication
 func (c *DockerRegistryProxyClient) makeRequest(ctx context.Context, method, path string, headers map[string]string) (*http.Response, error) {
 	url := c.baseURL + path
@@ -39,8 +74,8 @@ func (c *DockerRegistryProxyClient) makeRequest(ctx context.Context, method, pat
 	}
 
 	// Add authentication if credentials are provided
-	if c.username != "" && c.password != "" {
-		req.SetBasicAuth(c.username, c.password)
+	if c.authHeader != "" {
+		req.Header.Set("Authorization", c.authHeader)
 	}
 
 	// Add custom headers
@@ -48,11 +83,6 @@ func (c *DockerRegistryProxyClient) makeRequest(ctx context.Context, method, pat
 		req.Header.Set(k, v)
 	}
 
-	// Set Accept header for manifests
-	if method == http.MethodGet && (path[len(path)-9:] == "/manifests" || path[len(path)-10:] == "/manifest/") {
-		req.Header.Set("Accept", "application/vnd.docker.distribution.manifest.v2+json, application/vnd.oci.image.manifest.v1+json, */*")
-	}
-
 	resp, err := c.httpClient.Do(req)
 	if err != nil {
 		return nil, fmt.Errorf("failed to execute request: %w", err)
@@ -61,23 +91,33 @@ func (c *DockerRegistryProxyClient) makeRequest(ctx context.Context, method, pat
 	return resp, nil
 }
 
+// closeResponse drains a bounded amount of the unread body before closing it,
+// so the keep-alive connection goes back to the pool instead of being torn down
+func closeResponse(resp *http.Response) {
+	io.Copy(io.Discard, io.LimitReader(resp.Body, maxDrainSize))
+	resp.Body.Close()
+}
+
 // GetManifest fetches a manifest from the upstream registry
 func (c *DockerRegistryProxyClient) GetManifest(ctx context.Context, name, reference string) ([]byte, string, error) {
 	path := fmt.Sprintf("/v2/%s/manifests/%s", name, reference)
-	resp, err := c.makeRequest(ctx, http.MethodGet, path, nil)
+	resp, err := c.makeRequest(ctx, http.MethodGet, path, manifestHeaders)
 	if err != nil {
 		return nil, "", err
 	}
-	defer resp.Body.Close()
+	defer closeResponse(resp)
 
 	if resp.StatusCode != http.StatusOK {
 		return nil, "", fmt.Errorf("upstream registry returned status %d", resp.StatusCode)
 	}
 
-	body, err := io.ReadAll(resp.Body)
+	body, err := io.ReadAll(io.LimitReader(resp.Body, maxManifestSize+1))
 	if err != nil {
 		return nil, "", fmt.Errorf("failed to read response body: %w", err)
 	}
+	if len(body) > maxManifestSize {
+		return nil, "", fmt.Errorf("upstream manifest exceeds %d bytes", maxManifestSize)
+	}
 
 	mediaType := resp.Header.Get("Content-Type")
 
@@ -87,11 +127,11 @@ func (c *DockerRegistryProxyClient) GetManifest(ctx context.Context, name, refer
 // CheckManifestExists checks if a manifest exists in the upstream registry
 func (c *DockerRegistryProxyClient) CheckManifestExists(ctx context.Context, name, reference string) (bool, string, error) {
 	path := fmt.Sprintf("/v2/%s/manifests/%s", name, reference)
-	resp, err := c.makeRequest(ctx, http.MethodHead, path, nil)
+	resp, err := c.makeRequest(ctx, http.MethodHead, path, manifestHeaders)
 	if err != nil {
 		return false, "", err
 	}
-	defer resp.Body.Close()
+	defer closeResponse(resp)
 
 	if resp.StatusCode == http.StatusOK {
 		digest := resp.Header.Get("Docker-Content-Digest")
@@ -110,7 +150,7 @@ func (c *DockerRegistryProxyClient) GetBlob(ctx context.Context, name, digest st
 	}
 
 	if resp.StatusCode != http.StatusOK {
-		resp.Body.Close()
+		closeResponse(resp)
 		return nil, 0, fmt.Errorf("upstream registry returned status %d", resp.StatusCode)
 	}
 
@@ -124,7 +164,7 @@ func (c *DockerRegistryProxyClient) CheckBlobExists(ctx context.Context, name, d
 	if err != nil {
 		return false, 0, err
 	}
-	defer resp.Body.Close()
+	defer closeResponse(resp)
 
 	if resp.StatusCode == http.StatusOK {
 		return true, resp.ContentLength, nil
@@ -0,0 +1,117 @@
+package proxy
+
+import (
+	"context"
+	"net"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"sync/atomic"
+	"testing"
+
+	"github.com/basakil/brm-server/pkg/models"
+)
+
+// setupTestUpstream starts a fake upstream registry and returns a client pointed at it
+func setupTestUpstream(t *testing.T, handler http.HandlerFunc) *DockerRegistryProxyClient {
+	server := httptest.NewServer(handler)
+	t.Cleanup(server.Close)
+
+	return NewDockerRegistryProxyClient(&models.UpstreamRegistry{
+		URL:      server.URL,
+		Username: "user",
+		Password: "secret",
+	})
+}
+
+// TestDockerRegistryProxyClientManifestHeaders tests that manifest requests carry Accept and auth headers
+func TestDockerRegistryProxyClientManifestHeaders(t *testing.T) {
+	var gotAccept, gotUser, gotPassword string
+	var gotAuth bool
+	client := setupTestUpstream(t, func(w http.ResponseWriter, r *http.Request) {
+		gotAccept = r.Header.Get("Accept")
+		gotUser, gotPassword, gotAuth = r.BasicAuth()
+		w.Header().Set("Content-Type", "application/vnd.oci.image.manifest.v1+json")
+		w.Header().Set("Docker-Content-Digest", "sha256:abc")
+		w.WriteHeader(http.StatusOK)
+		if r.Method == http.MethodGet {
+			w.Write([]byte(`{"schemaVersion":2}`))
+		}
+	})
+	ctx := context.Background()
+
+	data, mediaType, err := client.GetManifest(ctx, "library/alpine", "latest")
+	if err != nil {
+		t.Fatalf("GetManifest failed: %v", err)
+	}
+	if string(data) != `{"schemaVersion":2}` {
+		t.Errorf("Unexpected manifest data: %s", data)
+	}
+	if mediaType != "application/vnd.oci.image.manifest.v1+json" {
+		t.Errorf("Unexpected media type: %s", mediaType)
+	}
+	if gotAccept != manifestHeaders["Accept"] {
+		t.Errorf("GET manifest Accept header = %q, want %q", gotAccept, manifestHeaders["Accept"])
+	}
+	if !gotAuth || gotUser != "user" || gotPassword != "secret" {
+		t.Errorf("GET manifest basic auth = (%q, %q, %v), want (user, secret, true)", gotUser, gotPassword, gotAuth)
+	}
+
+	gotAccept = ""
+	exists, digest, err := client.CheckManifestExists(ctx, "library/alpine", "latest")
+	if err != nil {
+		t.Fatalf("CheckManifestExists failed: %v", err)
+	}
+	if !exists || digest != "sha256:abc" {
+		t.Errorf("CheckManifestExists = (%v, %q), want (true, sha256:abc)", exists, digest)
+	}
+	if gotAccept != manifestHeaders["Accept"] {
+		t.Errorf("HEAD manifest Accept header = %q, want %q", gotAccept, manifestHeaders["Accept"])
+	}
+}
+
+// TestDockerRegistryProxyClientShortPath tests that requests with short paths do not panic
+func TestDockerRegistryProxyClientShortPath(t *testing.T) {
+	client := setupTestUpstream(t, func(w http.ResponseWriter, r *http.Request) {
+		w.WriteHeader(http.StatusOK)
+	})
+
+	resp, err := client.makeRequest(context.Background(), http.MethodGet, "/v2/", nil)
+	if err != nil {
+		t.Fatalf("makeRequest failed: %v", err)
+	}
+	resp.Body.Close()
+}
+
+// TestDockerRegistryProxyClientReusesConnectionAfterError tests that error responses are drained
+// so the next request reuses the same upstream connection
+func TestDockerRegistryProxyClientReusesConnectionAfterError(t *testing.T) {
+	var newConns atomic.Int32
+	server := httptest.NewUnstartedServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.WriteHeader(http.StatusNotFound)
+		w.Write([]byte(strings.Repeat("x", 8192)))
+	}))
+	server.Config.ConnState = func(conn net.Conn, state http.ConnState) {
+		if state == http.StateNew {
+			newConns.Add(1)
+		}
+	}
+	server.Start()
+	t.Cleanup(server.Close)
+
+	client := NewDockerRegistryProxyClient(&models.UpstreamRegistry{URL: server.URL})
+	ctx := context.Background()
+
+	for i := 0; i < 3; i++ {
+		if _, _, err := client.GetManifest(ctx, "library/alpine", "latest"); err == nil {
+			t.Fatalf("GetManifest should fail on 404")
+		}
+		if _, _, err := client.GetBlob(ctx, "library/alpine", "sha256:abc"); err == nil {
+			t.Fatalf("GetBlob should fail on 404")
+		}
+	}
+
+	if got := newConns.Load(); got != 1 {
+		t.Errorf("Expected 1 upstream connection, got %d", got)
+	}
+}
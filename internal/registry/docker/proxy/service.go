@@ -81,34 +81,22 @@ func (s *DockerRegistryProxyService) GetManifest(ctx context.Context, name, refe
 	// Check cache
 	meta, err := s.storage.GetMeta(ctx, cacheKey)
 	if err == nil && meta != nil && !s.isCacheExpired(meta) {
-		// Cache hit - read from cache
-		readReq := models.ArtifactRange{
-			Hash: cacheKey,
-			Range: models.ByteRange{
-				Offset: 0,
-				Length: -1,
-			},
-		}
-		rc, _, err := s.storage.Read(ctx, readReq)
-		if err == nil {
-			defer rc.Close()
-			cachedData, err := io.ReadAll(rc)
-			if err == nil {
-				return cachedData, mediaType, nil
-			}
-		}
+		// Cache hit - the key is the digest of manifestData, so the cached copy holds
+		// the same bytes; skip reading it back and return what we already have
+		return manifestData, mediaType, nil
 	}
 
 	// Cache miss or expired - store in cache
+	now := time.Now().Unix()
 	ref := models.ArtifactReference{
 		Name:                name,
 		Repo:                "manifest",
-		ReferencedTimestamp: time.Now().Unix(),
+		ReferencedTimestamp: now,
 	}
 	meta = &models.ArtifactMeta{
 		Hash:             cacheKey,
 		Length:           int64(len(manifestData)),
-		CreatedTimestamp: time.Now().Unix(),
+		CreatedTimestamp: now,
 		References:       []models.ArtifactReference{ref},
 	}
 
@@ -162,15 +150,16 @@ func (s *DockerRegistryProxyService) GetBlob(ctx context.Context, name, digest s
 	responseReader, responseWriter := io.Pipe()
 
 	// Prepare metadata for cache
+	now := time.Now().Unix()
 	ref := models.ArtifactReference{
 		Name:                name,
 		Repo:                "blob",
-		ReferencedTimestamp: time.Now().Unix(),
+		ReferencedTimestamp: now,
 	}
 	meta = &models.ArtifactMeta{
 		Hash:             cacheKey,
 		Length:           size,
-		CreatedTimestamp: time.Now().Unix(),
+		CreatedTimestamp: now,
 		References:       []models.ArtifactReference{ref},
 	}
 
@@ -63,33 +63,21 @@ func (s *SimpleFileStorage) getTrashPath(hash string) (dir, artifactPath, metaPa
 // If a reference with the same Name+Repo exists, updates ReferencedTimestamp to the latest.
 func mergeReferences(existing, new []models.ArtifactReference) []models.ArtifactReference {
 	result := make([]models.ArtifactReference, 0, len(existing)+len(new))
-	refMap := make(map[string]int) // key: "name:repo", value: index in result
-
-	// Add existing references to map
-	for _, ref := range existing {
-		key := ref.Name + ":" + ref.Repo
-		if idx, exists := refMap[key]; exists {
-			// Update timestamp if new one is later
-			if ref.ReferencedTimestamp > result[idx].ReferencedTimestamp {
-				result[idx].ReferencedTimestamp = ref.ReferencedTimestamp
+	refMap := make(map[string]int, len(existing)+len(new)) // key: "name:repo", value: index in result
+
+	// Walk existing references first, then new ones, in a single loop
+	for _, refs := range [2][]models.ArtifactReference{existing, new} {
+		for _, ref := range refs {
+			key := ref.Name + ":" + ref.Repo
+			if idx, exists := refMap[key]; exists {
+				// Update timestamp if new one is later
+				if ref.ReferencedTimestamp > result[idx].ReferencedTimestamp {
+					result[idx].ReferencedTimestamp = ref.ReferencedTimestamp
+				}
+			} else {
+				result = append(result, ref)
+				refMap[key] = len(result) - 1
 			}
-		} else {
-			result = append(result, ref)
-			refMap[key] = len(result) - 1
-		}
-	}
-
-	// Add new references
-	for _, ref := range new {
-		key := ref.Name + ":" + ref.Repo
-		if idx, exists := refMap[key]; exists {
-			// Update timestamp if new one is later
-			if ref.ReferencedTimestamp > result[idx].ReferencedTimestamp {
-				result[idx].ReferencedTimestamp = ref.ReferencedTimestamp
-			}
-		} else {
-			result = append(result, ref)
-			refMap[key] = len(result) - 1
 		}
 	}
 